@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+from numpy.random.mtrand import RandomState
 
 from spn.algorithms.Inference import log_likelihood
 from spn.io.CPP import get_cpp_function, setup_cpp_bridge
@@ -9,7 +10,8 @@ from spn.structure.leaves.parametric.Parametric import Gaussian
 
 
 class TestCPP(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         add_parametric_inference_support()
 
     def test_bcpp(self):
@@ -26,16 +28,15 @@ class TestCPP(unittest.TestCase):
         setup_cpp_bridge(A)
         spn_cc_eval_func = get_cpp_function(A)
 
-        np.random.seed(17)
-        data = np.random.normal(10, 0.01, size=200000).tolist() + np.random.normal(30, 10, size=200000).tolist()
+        rand_gen = RandomState(17)
+        data = rand_gen.normal(10, 0.01, size=200000).tolist() + rand_gen.normal(30, 10, size=200000).tolist()
         data = np.array(data).reshape((-1, 2))
 
         py_ll = log_likelihood(A, data)
 
         c_ll = spn_cc_eval_func(data)
 
-        for i in range(py_ll.shape[0]):
-            self.assertAlmostEqual(py_ll[i, 0], c_ll[i, 0])
+        np.testing.assert_allclose(py_ll[:, 0], c_ll[:, 0], rtol=0, atol=5e-8)
 
 
 if __name__ == "__main__":
@@ -5,14 +5,14 @@ import numpy as np
 from spn.algorithms.Inference import log_likelihood
 from spn.algorithms.MPE import mpe
 from spn.io.CPP import get_cpp_function, setup_cpp_bridge, get_cpp_mpe_function
-from spn.io.Graphics import plot_spn
 from spn.structure.Base import get_nodes_by_type
 from spn.structure.leaves.parametric.Inference import add_parametric_inference_support
-from spn.structure.leaves.parametric.Parametric import Gaussian, Bernoulli
+from spn.structure.leaves.parametric.Parametric import Bernoulli
 
 
 class TestCPP(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         add_parametric_inference_support()
 
     def test_binary(self):
@@ -50,10 +50,9 @@ class TestCPP(unittest.TestCase):
         ### Testing for MPE.
         spn_cc_mpe_func_bernoulli = get_cpp_mpe_function(A)
 
-        # drop some data.
-        for i in range(data.shape[0]):
-            drop_data = np.random.binomial(data.shape[1] - 1, 0.5)
-            data[i, drop_data] = np.nan
+        # drop some data: one randomly chosen feature per row.
+        drop_data = np.random.binomial(data.shape[1] - 1, 0.5, size=data.shape[0])
+        data[np.arange(data.shape[0]), drop_data] = np.nan
 
         cc_completion = spn_cc_mpe_func_bernoulli(data)
         py_completion = mpe(A, data)
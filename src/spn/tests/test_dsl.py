@@ -1,13 +1,13 @@
 import unittest
 
-from spn.io.Text import to_JSON, spn_to_str_equation
-from spn.structure.Base import assign_ids
+from spn.io.Text import spn_to_str_equation
 from spn.structure.leaves.parametric.Parametric import Gaussian
 from spn.structure.leaves.parametric.Text import add_parametric_text_support
 
 
 class TestDSL(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         add_parametric_text_support()
 
     def test_sum(self):
@@ -1,5 +1,7 @@
 import unittest
 
+from numpy.random.mtrand import RandomState
+
 from spn.algorithms.stats.Expectations import Expectation
 from spn.structure.Base import Context
 from spn.structure.StatisticalTypes import MetaType
@@ -10,7 +12,7 @@ from spn.structure.leaves.piecewise.PiecewiseLinear import create_piecewise_leaf
 
 class TestParametric(unittest.TestCase):
     def setUp(self):
-        np.random.seed(17)
+        self.rand_gen = RandomState(17)
 
     def test_Parametric_expectations(self):
         spn = 0.3 * (Gaussian(1.0, 1.0, scope=[0]) * Gaussian(5.0, 1.0, scope=[1])) + 0.7 * (
@@ -25,7 +27,7 @@ class TestParametric(unittest.TestCase):
         self.assertAlmostEqual(0.3 * 5.0 + 0.7 * 15.0, expectation[0, 0], 3)
 
     def test_Histogram_expectations(self):
-        data = np.random.randn(20000).reshape(-1, 1)
+        data = self.rand_gen.randn(20000).reshape(-1, 1)
         ds_context = Context(meta_types=[MetaType.REAL])
         ds_context.add_domains(data)
         hl = create_histogram_leaf(data, ds_context, scope=[0])
@@ -33,7 +35,7 @@ class TestParametric(unittest.TestCase):
 
         self.assertAlmostEqual(np.mean(data[:, 0]), expectation[0, 0], 3)
 
-        data = np.random.randint(0, high=100, size=20000).reshape(-1, 1)
+        data = self.rand_gen.randint(0, high=100, size=20000).reshape(-1, 1)
         ds_context = Context(meta_types=[MetaType.DISCRETE])
         ds_context.add_domains(data)
         hl = create_histogram_leaf(data, ds_context, scope=[0])
@@ -42,7 +44,7 @@ class TestParametric(unittest.TestCase):
         self.assertAlmostEqual(np.mean(data[:, 0]), expectation[0, 0], 3)
 
     def test_Piecewise_expectations(self):
-        data = np.random.normal(loc=100.0, scale=5.00, size=20000).reshape(-1, 1)
+        data = self.rand_gen.normal(loc=100.0, scale=5.00, size=20000).reshape(-1, 1)
         ds_context = Context(meta_types=[MetaType.REAL])
         ds_context.add_domains(data)
         pl = create_piecewise_leaf(data, ds_context, scope=[0], prior_weight=None)
@@ -50,7 +52,7 @@ class TestParametric(unittest.TestCase):
 
         self.assertAlmostEqual(np.mean(data[:, 0]), expectation[0, 0], 2)
 
-        data = np.random.randint(0, high=100, size=2000).reshape(-1, 1)
+        data = self.rand_gen.randint(0, high=100, size=2000).reshape(-1, 1)
         ds_context = Context(meta_types=[MetaType.DISCRETE])
         ds_context.add_domains(data)
         pl = create_piecewise_leaf(data, ds_context, scope=[0], prior_weight=None)
@@ -61,11 +63,11 @@ class TestParametric(unittest.TestCase):
     def test_Piecewise_expectations_with_evidence(self):
         adata = np.zeros((20000, 2))
         adata[:, 1] = 0
-        adata[:, 0] = np.random.normal(loc=100.0, scale=5.00, size=adata.shape[0])
+        adata[:, 0] = self.rand_gen.normal(loc=100.0, scale=5.00, size=adata.shape[0])
 
         bdata = np.zeros_like(adata)
         bdata[:, 1] = 1
-        bdata[:, 0] = np.random.normal(loc=50.0, scale=5.00, size=bdata.shape[0])
+        bdata[:, 0] = self.rand_gen.normal(loc=50.0, scale=5.00, size=bdata.shape[0])
 
         data = np.vstack((adata, bdata))
 
@@ -4,8 +4,6 @@ import numpy as np
 
 from spn.algorithms.Validity import is_valid
 
-from spn.algorithms.Inference import likelihood
-from spn.structure.leaves.histogram.Histograms import Histogram
 from spn.structure.leaves.piecewise.PiecewiseLinear import PiecewiseLinear
 from spn.algorithms.Gradient import feature_gradient
 
@@ -22,11 +20,10 @@ class TestGradient(unittest.TestCase):
         results = feature_gradient(piecewise_spn, evidence)
         expected_results = np.array([[0.5], [-0.5], [-0.5], [0.5]])
 
-        for i, _ in enumerate(evidence):
-            self.assertTrue(
-                results[i] == expected_results[i],
-                "Expected result was {}, but computed result was {}".format(expected_results[i], results[i]),
-            )
+        self.assertTrue(
+            np.array_equal(results, expected_results),
+            "Expected result was {}, but computed result was {}".format(expected_results, results),
+        )
 
     def test_piecewise_linear_combined(self):
         piecewise_spn = (
@@ -44,7 +41,7 @@ class TestGradient(unittest.TestCase):
         expected_results = np.array([[0.25, 0.125], [-0.125, 0.125], [0.25, 0]])
 
         self.assertTrue(
-            np.all(np.isclose(results, expected_results, atol=0.000001)),
+            np.allclose(results, expected_results, atol=0.000001),
             "Expected result was {}, but computed result was {}".format(expected_results, results),
         )
 
@@ -7,10 +7,12 @@ from spn.structure.leaves.histogram.Histograms import create_histogram_leaf
 from spn.structure.leaves.histogram.Inference import add_histogram_inference_support
 from spn.structure.leaves.parametric.Parametric import *
 import numpy as np
+from numpy.random.mtrand import RandomState
 
 
 class TestParametric(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         add_histogram_inference_support()
 
     def test_Histogram_discrete_inference(self):
@@ -41,8 +43,8 @@ class TestParametric(unittest.TestCase):
         self.assertAlmostEqual(float(prob[5]), 4 / 9)
 
     def test_spike(self):
-        np.random.seed(17)
-        data = np.random.normal(10, 0.01, size=200).tolist() + np.random.normal(30, 10, size=200).tolist()
+        rand_gen = RandomState(17)
+        data = rand_gen.normal(10, 0.01, size=200).tolist() + rand_gen.normal(30, 10, size=200).tolist()
         data = np.array(data).reshape((-1, 1))
         ds_context = Context([MetaType.REAL])
         ds_context.add_domains(data)
@@ -65,8 +67,8 @@ class TestParametric(unittest.TestCase):
         # plt.show()
 
     def test_mixture_gaussians(self):
-        np.random.seed(17)
-        data = np.random.normal(10, 1, size=200).tolist() + np.random.normal(30, 1, size=200).tolist()
+        rand_gen = RandomState(17)
+        data = rand_gen.normal(10, 1, size=200).tolist() + rand_gen.normal(30, 1, size=200).tolist()
         data = np.array(data).reshape((-1, 1))
         ds_context = Context([MetaType.REAL])
         ds_context.add_domains(data)
@@ -93,11 +95,7 @@ class TestParametric(unittest.TestCase):
 
 
     def test_histogram_samples(self):
-        import numpy as np
-        from numpy.random.mtrand import RandomState
         from spn.algorithms.Sampling import sample_instances
-        from spn.structure.Base import Context
-        from spn.structure.StatisticalTypes import MetaType
         from spn.algorithms.LearningWrappers import learn_mspn
 
         np.random.seed(123)
@@ -111,7 +109,7 @@ class TestParametric(unittest.TestCase):
             meta_types=[MetaType.DISCRETE, MetaType.DISCRETE, MetaType.REAL, MetaType.REAL]).add_domains(train_data)
         mspn = learn_mspn(train_data, ds_context, min_instances_slice=200)
 
-        samples = sample_instances(mspn, np.array([np.nan, np.nan, np.nan, np.nan] * 100).reshape(-1, 4), RandomState(123))
+        samples = sample_instances(mspn, np.full((100, 4), np.nan), RandomState(123))
         print(np.max(samples, axis=0), np.min(samples, axis=0))
         print(ds_context.domains)
 
@@ -127,16 +125,12 @@ class TestParametric(unittest.TestCase):
         # print(1)
 
     def test_singular_domain(self):
-        import numpy as np
         np.random.seed(123)
 
         b = np.random.randint(3, size=1000).reshape(-1, 1)
         d = np.random.randint(2, size=1000).reshape(-1, 1)
         train_data = np.c_[b, d]
 
-        from spn.structure.Base import Context
-        from spn.structure.StatisticalTypes import MetaType
-
         ds_context = Context(meta_types=[MetaType.DISCRETE, MetaType.BINARY])
         ds_context.add_domains(train_data)
 
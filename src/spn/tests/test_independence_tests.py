@@ -5,6 +5,7 @@ Created on December 12, 2018
 """
 import unittest
 import numpy as np
+from numpy.random.mtrand import RandomState
 
 from spn.algorithms.splitting.PoissonStabilityTest import get_split_cols_poisson_py
 from spn.structure.Base import Context
@@ -13,18 +14,18 @@ from spn.structure.leaves.parametric.Parametric import Poisson
 
 class TestIndependence(unittest.TestCase):
     def test_poisson(self):
-        np.random.seed(17)
+        rand_gen = RandomState(17)
         y = np.concatenate(
             (
-                np.random.poisson(5, 1000).reshape(-1, 1),
-                np.random.poisson(10, 1000).reshape(-1, 1),
-                np.random.poisson(25, 1000).reshape(-1, 1),
-                np.random.poisson(35, 1000).reshape(-1, 1),
+                rand_gen.poisson(5, 1000).reshape(-1, 1),
+                rand_gen.poisson(10, 1000).reshape(-1, 1),
+                rand_gen.poisson(25, 1000).reshape(-1, 1),
+                rand_gen.poisson(35, 1000).reshape(-1, 1),
             ),
             axis=1,
         )
 
-        y = np.concatenate((y, (y[:, 0] + np.random.poisson(0.001, 1000)).reshape(-1, 1)), axis=1)
+        y = np.concatenate((y, (y[:, 0] + rand_gen.poisson(0.001, 1000)).reshape(-1, 1)), axis=1)
 
         test = get_split_cols_poisson_py(alpha=0.3, n_jobs=20)
 
@@ -14,14 +14,22 @@ from spn.algorithms.layerwise.type_checks import (
     check_valid,
     OutOfBoundsException,
     InvalidTypeException,
-    InvalidStackedSpnConfigurationException,
 )
-from spn.algorithms.layerwise.utils import SamplingContext, provide_evidence
+from spn.algorithms.layerwise.utils import SamplingContext
+
+
+def setUpModule():
+    """Seed all random number generators so that runs under any test runner are reproducible."""
+    seed = 0
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
 
 
 class TestLayerwiseImplementation(unittest.TestCase):
     """Testcases taht ensure, that inference methods for Sum, Product and Leaf layers are working as expected."""
 
+    @torch.no_grad()
     def test_sum_layer(self):
         """Test the forward pass of a sum layer"""
 
@@ -64,8 +72,9 @@ class TestLayerwiseImplementation(unittest.TestCase):
         self.assertTrue(result.shape[1] == in_features)
         self.assertTrue(result.shape[2] == out_channels)
         self.assertTrue(result.shape[3] == num_repetitions)
-        self.assertTrue(((result - expected_result).abs() < 1e-6).all())
+        torch.testing.assert_close(result, expected_result, rtol=0.0, atol=1e-6)
 
+    @torch.no_grad()
     def test_product_layer(self):
         """Test the product layer forward pass."""
 
@@ -97,8 +106,9 @@ class TestLayerwiseImplementation(unittest.TestCase):
         self.assertTrue(result.shape[1] == in_features // cardinality)
         self.assertTrue(result.shape[2] == in_channels)
         self.assertTrue(result.shape[3] == num_repetitions)
-        self.assertTrue(((result - expected_result).abs() < 1e-6).all())
+        torch.testing.assert_close(result, expected_result, rtol=0.0, atol=1e-6)
 
+    @torch.no_grad()
     def test_normal_leaf_layer(self):
         """Test the normal leaf layer."""
         # Setup leaf layer
@@ -137,7 +147,7 @@ class TestLayerwiseImplementation(unittest.TestCase):
         self.assertEqual(result.shape[0], batch_size)
         self.assertEqual(result.shape[1], in_features)
         self.assertEqual(result.shape[2], out_channels)
-        self.assertTrue(((result - expected_result).abs() < 1e-6).all())
+        torch.testing.assert_close(result, expected_result, rtol=0.0, atol=1e-6)
 
 
 class TestLayerwiseSampling(unittest.TestCase):
@@ -196,8 +206,7 @@ class TestLayerwiseSampling(unittest.TestCase):
         sum_layer.sample(context=ctx)
 
         # Assert that the sample indexes are those where the weights were set to 1.0
-        for i in range(n):
-            self.assertTrue((rand_indxs[:, rep_idxs[i]] == ctx.parent_indices[i, :]).all())
+        self.assertTrue(torch.equal(rand_indxs[:, rep_idxs].T, ctx.parent_indices))
 
     def test_prod_as_intermediate_node(self):
         # Product layer values
@@ -212,29 +221,15 @@ class TestLayerwiseSampling(unittest.TestCase):
             # Example parent indexes
             parent_indices = torch.randint(high=5, size=(num_samples, in_features))
 
-            # Create expected indexes: each index is repeated #cardinality times
+            # Create expected indexes: output feature k takes the index of parent feature k // cardinality,
+            # i.e. each index is repeated #cardinality times, then the padding is removed
             pad = (cardinality - in_features % cardinality) % cardinality
-            expected_sample_indices = []
-            for j in range(num_samples):
-
-                sample_i_indices = []
-                for i in parent_indices[j, :]:
-                    sample_i_indices += [i] * cardinality
-
-                # Remove padding
-                if pad > 0:
-                    sample_i_indices = sample_i_indices[:-pad]
-
-                # Add current sample
-                expected_sample_indices.append(sample_i_indices)
-
-            # As tensor
-            expected_sample_indices = torch.tensor(expected_sample_indices)
+            expected_sample_indices = parent_indices[:, torch.arange(in_features * cardinality - pad) // cardinality]
 
             # Sample
             ctx = SamplingContext(n=num_samples, parent_indices=parent_indices)
             prod_layer.sample(context=ctx)
-            self.assertTrue((expected_sample_indices == ctx.parent_indices).all())
+            self.assertTrue(torch.equal(expected_sample_indices, ctx.parent_indices))
 
     def test_normal_leaf(self):
         # Setup leaf layer
@@ -264,9 +259,8 @@ class TestLayerwiseSampling(unittest.TestCase):
         # Run assertions
         self.assertTrue(((result - expected_result).abs() < 1e-6).all())
 
-    def test_spn_sampling(self):
-
-        # Define SPN
+    def _make_spn(self):
+        """Create the layers of a small SPN over 2 ** 3 features, ordered from the leaves to the root."""
         leaf = distributions.Normal(in_features=2 ** 3, out_channels=5, num_repetitions=1)
         sum_1 = layers.Sum(in_channels=5, in_features=2 ** 3, out_channels=20, num_repetitions=1)
         prd_1 = layers.Product(in_features=2 ** 3, cardinality=2, num_repetitions=1)
@@ -275,6 +269,13 @@ class TestLayerwiseSampling(unittest.TestCase):
         sum_3 = layers.Sum(in_channels=20, in_features=2 ** 1, out_channels=20, num_repetitions=1)
         prd_3 = layers.Product(in_features=2 ** 1, cardinality=2, num_repetitions=1)
         sum_4 = layers.Sum(in_channels=20, in_features=2 ** 0, out_channels=1, num_repetitions=1)
+        return leaf, sum_1, prd_1, sum_2, prd_2, sum_3, prd_3, sum_4
+
+    @torch.no_grad()
+    def test_spn_sampling(self):
+
+        # Define SPN
+        leaf, sum_1, prd_1, sum_2, prd_2, sum_3, prd_3, sum_4 = self._make_spn()
 
         # Test forward pass
         x_test = torch.randn(1, 2 ** 3)
@@ -299,17 +300,11 @@ class TestLayerwiseSampling(unittest.TestCase):
         sum_1.sample(context=ctx)
         samples = leaf.sample(context=ctx)
 
+    @torch.no_grad()
     def test_spn_mpe(self):
 
         # Define SPN
-        leaf = distributions.Normal(in_features=2 ** 3, out_channels=5, num_repetitions=1)
-        sum_1 = layers.Sum(in_channels=5, in_features=2 ** 3, out_channels=20, num_repetitions=1)
-        prd_1 = layers.Product(in_features=2 ** 3, cardinality=2, num_repetitions=1)
-        sum_2 = layers.Sum(in_channels=20, in_features=2 ** 2, out_channels=20, num_repetitions=1)
-        prd_2 = layers.Product(in_features=2 ** 2, cardinality=2, num_repetitions=1)
-        sum_3 = layers.Sum(in_channels=20, in_features=2 ** 1, out_channels=20, num_repetitions=1)
-        prd_3 = layers.Product(in_features=2 ** 1, cardinality=2, num_repetitions=1)
-        sum_4 = layers.Sum(in_channels=20, in_features=2 ** 0, out_channels=1, num_repetitions=1)
+        leaf, sum_1, prd_1, sum_2, prd_2, sum_3, prd_3, sum_4 = self._make_spn()
 
         sum_1._enable_input_cache()
         sum_2._enable_input_cache()
@@ -341,8 +336,8 @@ class TestLayerwiseSampling(unittest.TestCase):
         mpe_1 = leaf.sample(context=ctx)
         mpe_2 = leaf.sample(context=ctx)
         mpe_3 = leaf.sample(context=ctx)
-        self.assertTrue(((mpe_1 - mpe_2).abs() < 1e-6).all())
-        self.assertTrue(((mpe_2 - mpe_3).abs() < 1e-6).all())
+        torch.testing.assert_close(mpe_1, mpe_2, rtol=0.0, atol=1e-6)
+        torch.testing.assert_close(mpe_2, mpe_3, rtol=0.0, atol=1e-6)
 
 
 class TestTypeChecks(unittest.TestCase):
@@ -366,31 +361,31 @@ class TestTypeChecks(unittest.TestCase):
         check_valid(torch.tensor(1.0).double(), float, 0)
 
     def test_invalid_range(self):
-        with self.assertRaises(OutOfBoundsException):
-            check_valid(0, int, 1, 2)
-
-        with self.assertRaises(OutOfBoundsException):
-            check_valid(0.0, float, 1.0, 2.0)
-
-        with self.assertRaises(OutOfBoundsException):
-            check_valid(2, int, 0, 1)
+        invalid_args = [
+            (0, int, 1, 2),
+            (0.0, float, 1.0, 2.0),
+            (2, int, 0, 1),
+        ]
+        for args in invalid_args:
+            with self.subTest(args=args), self.assertRaises(OutOfBoundsException):
+                check_valid(*args)
 
     def test_invalid_type(self):
-        with self.assertRaises(InvalidTypeException):
-            check_valid(0, float, 0, 1)
-
-        with self.assertRaises(InvalidTypeException):
-            check_valid(0.0, int, 0, 1)
-
-        with self.assertRaises(InvalidTypeException):
-            check_valid(np.int64(0), float, 0, 1)
-
-        with self.assertRaises(InvalidTypeException):
-            check_valid(torch.tensor(0).int(), float, 0, 1)
+        invalid_args = [
+            (0, float, 0, 1),
+            (0.0, int, 0, 1),
+            (np.int64(0), float, 0, 1),
+            (torch.tensor(0).int(), float, 0, 1),
+        ]
+        for args in invalid_args:
+            with self.subTest(args=args), self.assertRaises(InvalidTypeException):
+                check_valid(*args)
 
 
 class TestRATLayerwise(unittest.TestCase):
-    def test_rat_forward(self):
+    @classmethod
+    def setUpClass(cls):
+        """Build the RatSpn once, the tests below do not modify its parameters."""
         from spn.experiments.RandomSPNs_layerwise.rat_spn import RatSpn
         from spn.experiments.RandomSPNs_layerwise.rat_spn import RatSpnConfig
         from spn.experiments.RandomSPNs_layerwise.distributions import RatNormal
@@ -406,35 +401,27 @@ class TestRATLayerwise(unittest.TestCase):
         config.dropout = 0.0
         config.leaf_base_class = RatNormal
 
-        spn = RatSpn(config)
+        cls.config = config
+        cls.spn = RatSpn(config)
+
+    @torch.no_grad()
+    def test_rat_forward(self):
+        config = self.config
 
         # Generate data
         batch_size = 32
         x = torch.randn(batch_size, config.F)
 
         # Forward pass
-        result = spn(x)
+        result = self.spn(x)
 
         # Make assertions on the shape
         self.assertEqual(result.shape[0], batch_size)
         self.assertEqual(result.shape[1], config.C)
 
     def test_rat_sampling(self):
-        from spn.experiments.RandomSPNs_layerwise.rat_spn import RatSpn
-        from spn.experiments.RandomSPNs_layerwise.rat_spn import RatSpnConfig
-        from spn.experiments.RandomSPNs_layerwise.distributions import RatNormal
-
-        # Setup RatSpn
-        config = RatSpnConfig()
-        config.F = 16
-        config.R = 13
-        config.D = 3
-        config.C = 2
-        config.I = 11
-        config.S = 12
-        config.dropout = 0.0
-        config.leaf_base_class = RatNormal
-        spn = RatSpn(config)
+        config = self.config
+        spn = self.spn
 
         # Sample
         n = 10
@@ -448,21 +435,8 @@ class TestRATLayerwise(unittest.TestCase):
         spn.sample(evidence=x)
 
     def test_rat_mpe(self):
-        from spn.experiments.RandomSPNs_layerwise.rat_spn import RatSpn
-        from spn.experiments.RandomSPNs_layerwise.rat_spn import RatSpnConfig
-        from spn.experiments.RandomSPNs_layerwise.distributions import RatNormal
-
-        # Setup RatSpn
-        config = RatSpnConfig()
-        config.F = 16
-        config.R = 13
-        config.D = 3
-        config.C = 2
-        config.I = 11
-        config.S = 12
-        config.dropout = 0.0
-        config.leaf_base_class = RatNormal
-        spn = RatSpn(config)
+        config = self.config
+        spn = self.spn
 
         # Conditional MPE
         x = torch.randn(10, config.F)
@@ -470,14 +444,9 @@ class TestRATLayerwise(unittest.TestCase):
         mpe_1 = spn.mpe(evidence=x)
         mpe_2 = spn.mpe(evidence=x)
         mpe_3 = spn.mpe(evidence=x)
-        self.assertTrue(((mpe_1 - mpe_2).abs() < 1e-6).all())
-        self.assertTrue(((mpe_2 - mpe_3).abs() < 1e-6).all())
-
+        torch.testing.assert_close(mpe_1, mpe_2, rtol=0.0, atol=1e-6)
+        torch.testing.assert_close(mpe_2, mpe_3, rtol=0.0, atol=1e-6)
 
 
 if __name__ == "__main__":
-    seed = 0
-    random.seed(seed)
-    np.random.seed(seed)
-    torch.manual_seed(seed)
     unittest.main()
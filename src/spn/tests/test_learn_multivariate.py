@@ -1,9 +1,5 @@
 import unittest
 
-from numpy.random.mtrand import RandomState
-from scipy.stats import multivariate_normal
-
-from spn.structure.Base import Leaf, bfs, get_topological_order, get_topological_order_layers
 import numpy as np
 
 
@@ -17,7 +13,7 @@ class TestBase(unittest.TestCase):
 
         train_data = np.hstack((X, y))
 
-        from spn.algorithms.LearningWrappers import learn_parametric, learn_classifier
+        from spn.algorithms.LearningWrappers import learn_parametric
         from spn.structure.leaves.parametric.Parametric import Categorical, MultivariateGaussian
         from spn.structure.Base import Context
 
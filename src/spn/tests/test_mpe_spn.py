@@ -9,7 +9,7 @@ from spn.structure.Base import assign_ids, Leaf, Context
 from spn.structure.StatisticalTypes import MetaType
 from spn.structure.leaves.parametric.Parametric import Gaussian, Categorical
 from spn.structure.leaves.piecewise.PiecewiseLinear import PiecewiseLinear
-from spn.structure.leaves.histogram.Histograms import Histogram, create_histogram_leaf
+from spn.structure.leaves.histogram.Histograms import create_histogram_leaf
 
 
 class TestMPE(unittest.TestCase):
@@ -3,7 +3,6 @@ import unittest
 import numpy as np
 
 from spn.algorithms.Validity import is_valid
-from spn.algorithms.stats.Expectations import Expectation
 from spn.algorithms.stats.Moments import get_mean
 from spn.structure.leaves.piecewise.PiecewiseLinear import PiecewiseLinear
 
@@ -6,8 +6,11 @@ from spn.structure.leaves.parametric.Parametric import *
 
 
 class TestParametric(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         add_parametric_inference_support()
+
+    def setUp(self):
         self.tested = set()
 
     def assert_correct(self, node, x, result):
@@ -17,7 +20,7 @@ class TestParametric(unittest.TestCase):
         node.scope = list(range(data.shape[1]))
         l = likelihood(node, data)
         self.assertAlmostEqual(result, l[0, 0], 5)
-        self.assertTrue(np.alltrue(np.isclose(np.log(l), log_likelihood(node, data))))
+        self.assertTrue(np.allclose(np.log(l), log_likelihood(node, data)))
 
         new_scope = (np.array(node.scope) + 5).tolist()
         data = np.random.rand(10, max(new_scope) + 2)
@@ -27,8 +30,8 @@ class TestParametric(unittest.TestCase):
         self.assertEqual(l.shape[0], data.shape[0])
         self.assertEqual(l.shape[1], 1)
         self.assertTrue(np.isclose(np.var(l), 0))
-        self.assertTrue(np.alltrue(np.isclose(result, l[0, 0])))
-        self.assertTrue(np.alltrue(np.isclose(np.log(l), log_likelihood(node, data))))
+        self.assertTrue(np.isclose(result, l[0, 0]))
+        self.assertTrue(np.allclose(np.log(l), log_likelihood(node, data)))
 
     def test_Parametric_inference(self):
 
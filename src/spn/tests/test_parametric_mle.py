@@ -1,4 +1,3 @@
-import json
 import unittest
 
 from spn.io.Text import to_JSON
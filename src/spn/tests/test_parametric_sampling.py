@@ -11,7 +11,8 @@ import os
 
 
 class TestParametricSampling(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         add_parametric_inference_support()
 
     def assert_correct_node_sampling_continuous(self, node, samples, plot):
@@ -15,7 +15,7 @@ class TestGradient(unittest.TestCase):
         evidence = np.array([[-2], [-1.5], [-1], [-0.5], [0], [0.5], [1], [1.5], [2], [3], [-3]])
         results = likelihood(piecewise_spn, evidence)
         expected_results = np.array([[0], [0.25], [0.5], [0.25], [0], [0.25], [0.5], [0.25], [0], [0], [0]])
-        self.assertTrue(np.all(np.equal(results, expected_results)))
+        np.testing.assert_array_equal(results, expected_results)
 
     def test_piecewise_linear_multiplied(self):
         piecewise_spn = (
@@ -44,7 +44,7 @@ class TestGradient(unittest.TestCase):
         )
         results = likelihood(piecewise_spn, evidence)
         expected_results = np.array([[0], [0.25], [0.5], [0.25], [0], [0.25], [0.5], [0.25], [0], [0], [0], [0]]) ** 2
-        self.assertTrue(np.all(np.equal(results, expected_results)))
+        np.testing.assert_array_equal(results, expected_results)
 
     def test_piecewise_linear_constant(self):
         piecewise_spn = 0.5 * PiecewiseLinear([1, 2], [1, 1], [], scope=[0]) + 0.5 * PiecewiseLinear(
@@ -54,7 +54,7 @@ class TestGradient(unittest.TestCase):
         evidence = np.array([[-3000]])
         results = likelihood(piecewise_spn, evidence)
         expected_results = np.array([[1]])
-        self.assertTrue(np.all(np.equal(results, expected_results)))
+        np.testing.assert_array_equal(results, expected_results)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,13 @@
 import unittest
 
-from spn.algorithms.Inference import likelihood, log_likelihood
+from numpy.random.mtrand import RandomState
+
+from spn.algorithms.Inference import log_likelihood
 from spn.structure.Base import Context
 from spn.structure.StatisticalTypes import MetaType
-from spn.structure.leaves.histogram.Histograms import create_histogram_leaf
-from spn.structure.leaves.histogram.Inference import add_histogram_inference_support
 from spn.structure.leaves.parametric.Parametric import *
 import numpy as np
 
-from spn.structure.leaves.piecewise.Inference import add_piecewise_inference_support
 from spn.structure.leaves.piecewise.PiecewiseLinear import create_piecewise_leaf
 
 
@@ -23,7 +22,8 @@ class TestPWL(unittest.TestCase):
     def test_PWL(self):
         # data = np.array([1.0, 1.0, 2.0, 3.0]*100).reshape(-1, 1)
 
-        data = np.r_[np.random.normal(10, 5, (300, 1)), np.random.normal(20, 10, (700, 1))]
+        rand_gen = RandomState(17)
+        data = np.r_[rand_gen.normal(10, 5, (300, 1)), rand_gen.normal(20, 10, (700, 1))]
 
         ds_context = Context([MetaType.REAL])
         ds_context.add_domains(data)
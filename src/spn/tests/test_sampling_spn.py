@@ -2,17 +2,12 @@ import unittest
 
 from numpy.random.mtrand import RandomState
 
-from spn.algorithms.Inference import add_node_likelihood, log_likelihood
 from spn.algorithms.Sampling import sample_instances
-from spn.structure.Base import assign_ids, Leaf, Sum, get_nodes_by_type
-
-from scipy.stats import chisquare
+from spn.structure.Base import assign_ids, Leaf
 
 import numpy as np
 
-from spn.structure.leaves.parametric.Inference import add_parametric_inference_support
 from spn.structure.leaves.parametric.Parametric import Gaussian, Categorical
-from spn.structure.leaves.parametric.Sampling import add_parametric_sampling_support
 
 
 class TestSampling(unittest.TestCase):
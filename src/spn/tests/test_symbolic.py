@@ -48,8 +48,8 @@ class TestSymbolic(unittest.TestCase):
 
         data = np.array([0, 0], dtype=np.float).reshape(-1, 2)
 
-        self.assertTrue(np.alltrue(np.isclose(np.log(sym_l), log_likelihood(root, data))))
-        self.assertTrue(np.alltrue(np.isclose(sym_ll, log_likelihood(root, data))))
+        self.assertTrue(np.allclose(np.log(sym_l), log_likelihood(root, data)))
+        self.assertTrue(np.allclose(sym_ll, log_likelihood(root, data)))
 
 
 if __name__ == "__main__":
@@ -19,7 +19,7 @@ class TestParametricSymbolic(unittest.TestCase):
 
         l = float(sympyecc.evalf(subs={"x0": x}))
         self.assertAlmostEqual(result, l, 5)
-        self.assertTrue(np.alltrue(np.isclose(np.log(l), log_likelihood(node, data))))
+        self.assertTrue(np.allclose(np.log(l), log_likelihood(node, data)))
 
         data = np.random.rand(10, 10)
         data[:, 5] = x
@@ -28,8 +28,8 @@ class TestParametricSymbolic(unittest.TestCase):
         self.assertEqual(l.shape[0], data.shape[0])
         self.assertEqual(l.shape[1], 1)
         self.assertTrue(np.isclose(np.var(l), 0))
-        self.assertTrue(np.alltrue(np.isclose(result, l[0, 0])))
-        self.assertTrue(np.alltrue(np.isclose(np.log(l), log_likelihood(node, data))))
+        self.assertTrue(np.isclose(result, l[0, 0]))
+        self.assertTrue(np.allclose(np.log(l), log_likelihood(node, data)))
 
     def test_Parametric_inference(self):
         # N[PDF[NormalDistribution[4, 1], 5], 6] = 0.241971
@@ -41,7 +41,7 @@ class TestTensorflow(unittest.TestCase):
 
         tf_ll = eval_tf(spn, data)
 
-        self.assertTrue(np.all(np.isclose(ll, tf_ll)))
+        self.assertTrue(np.allclose(ll, tf_ll))
 
         spn_copy = Copy(spn)
 
@@ -70,7 +70,7 @@ class TestTensorflow(unittest.TestCase):
 
         tf_ll = eval_tf(spn, data)
 
-        self.assertTrue(np.all(np.isclose(ll, tf_ll)))
+        self.assertTrue(np.allclose(ll, tf_ll))
 
     def test_eval_histogram(self):
         np.random.seed(17)
@@ -89,7 +89,7 @@ class TestTensorflow(unittest.TestCase):
 
         tf_ll = eval_tf(spn, data)
 
-        self.assertTrue(np.all(np.isclose(ll, tf_ll)))
+        self.assertTrue(np.allclose(ll, tf_ll))
 
     def test_optimization(self):
         np.random.seed(17)
@@ -125,7 +125,7 @@ class TestTensorflow(unittest.TestCase):
 
         # print(tf_ll_opt.sum(), py_ll_opt.sum())
 
-        self.assertTrue(np.all(np.isclose(tf_ll_opt, py_ll_opt)))
+        self.assertTrue(np.allclose(tf_ll_opt, py_ll_opt))
 
         self.assertLess(py_ll.sum(), tf_ll_opt.sum())
 
@@ -1,6 +1,6 @@
 import unittest
 
-from spn.structure.Base import Leaf, bfs
+from spn.structure.Base import Leaf
 
 from spn.io.plot.TreeVisualization import get_newick
 